@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+import argparse
+from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup as bs
+from menu_table import extract_menu_grid, dump_menu_grid
+
+# 식단표 추출 벤치마크
+# bench_pages/ 에 저장해 둔 todayMenu1, todayMenu2 페이지로 이전 방식과 격자 방식을 비교합니다.
+# 예: python bench_menu_table.py --repeat 50
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_pages')
+
+# (파일, 식단표 종류, 표에 들어 있는 날짜 수)
+CASES = [
+    ('todayMenu1_week.html', 'todayMenu1', 7),
+    ('todayMenu2_week.html', 'todayMenu2', 7),
+    ('todayMenu2_2weeks.html', 'todayMenu2', 14),
+    ('todayMenu1_month.html', 'todayMenu1', 31),
+]
+
+
+def legacy_menu1(html):
+    # 이전 scrape_menu_and_save_to_s3 의 표 처리 부분 (요청/업로드만 뺐습니다)
+    soup = BeautifulSoup(html, 'html.parser')
+
+    menu_data = []
+    current_date = ''
+
+    for row in soup.find_all('tr')[1:]:
+        columns = row.find_all('td')
+
+        if len(columns) > 0:
+            date_column = columns[0].get_text(strip=True).replace('\n', ' ')
+            meal_columns = [col.get_text(separator='\n', strip=True).replace('&amp;', '&') for col in columns[1:4]]
+
+            if "원산지" in date_column:
+                continue
+
+            if date_column:
+                if len(date_column) > 0:
+                    date_column = date_column.replace('월', ' 월').replace('화', ' 화').replace('수', ' 수').replace('목', ' 목').replace('금', ' 금')
+
+                current_date = date_column
+                menu_data.append(f'{current_date} 조식')
+
+                if len(meal_columns) > 0 and meal_columns[0]:
+                    menu_data.append(meal_columns[0])
+                else:
+                    menu_data.append('조식 없음')
+
+                menu_data.append('---')
+                menu_data.append(f'{current_date} 중식')
+
+                if len(meal_columns) > 1 and meal_columns[1]:
+                    menu_data.append(meal_columns[1])
+                else:
+                    menu_data.append('중식 없음')
+
+                menu_data.append('---')
+                menu_data.append(f'{current_date} 석식')
+
+                if len(meal_columns) > 2 and meal_columns[2]:
+                    menu_data.append(meal_columns[2])
+                else:
+                    menu_data.append('석식 없음')
+
+                menu_data.append('---')
+
+    formatted_data = '\n'.join([line for line in menu_data if line != '---\n---'])
+    return formatted_data.encode('utf-8')
+
+
+def legacy_menu2(html):
+    # 이전 scrape_and_upload_to_s3 의 표 처리 부분 (요청/업로드만 뺐습니다)
+    soup = bs(html, 'html.parser')
+    rows = soup.find_all('tr')
+
+    food_data = ""
+
+    for row in rows:
+        date_day_td = row.find('td', class_='text_center')
+        if date_day_td:
+            date_day = date_day_td.get_text(separator=' ', strip=True).split(' ')[0]
+            menu_tds = row.find_all('td')[1:]
+            meal_times = ['조식', '중식', '석식']
+            for index, menu_td in enumerate(menu_tds):
+                menu = menu_td.get_text(separator='\n', strip=True)
+                meal_time = meal_times[index] if index < len(meal_times) else f"식사 {index+1}"
+                food_data += f"{date_day} {meal_time}\n{menu}\n---\n"
+    return food_data
+
+
+# 식단표 종류 -> (이전 방식, extract_menu_grid 옵션) (핸들러와 같은 옵션)
+LAYOUTS = {
+    'todayMenu1': (legacy_menu1, {'max_meals': 3}),
+    'todayMenu2': (legacy_menu2, {'date_class': 'text_center'}),
+}
+
+
+def timed(func, html, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="식단표 추출 방식별 처리 시간을 비교합니다.")
+    parser.add_argument('--pages-dir', default=PAGES_DIR, help="식단표 페이지가 있는 폴더 (기본값 bench_pages)")
+    parser.add_argument('--repeat', type=int, default=20, help="반복 횟수 (가장 빠른 시간을 사용)")
+    args = parser.parse_args()
+
+    print(f"{'페이지':<26}{'이전(ms)':>10}{'격자(ms)':>10}{'일수':>6}")
+    for file_name, layout, days in CASES:
+        with open(os.path.join(args.pages_dir, file_name), encoding='utf-8') as f:
+            page = f.read()
+        legacy, options = LAYOUTS[layout]
+
+        grid = extract_menu_grid(page, **options)
+        if len(grid.days) != days:
+            print(f"{file_name}: 날짜 {days}개를 기대했지만 {len(grid.days)}개를 찾았습니다.")
+            return 1
+
+        legacy_time = timed(legacy, page, args.repeat)
+        grid_time = timed(lambda text: dump_menu_grid(extract_menu_grid(text, **options)), page, args.repeat)
+        print(f"{file_name:<26}{legacy_time * 1000:>10.2f}{grid_time * 1000:>10.2f}{days:>6}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import os
+import json
+import time
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import datetime, timedelta
+import requests
+from storage import get_storage
+
+SCHEDULE_URL = 'https://www.mmu.ac.kr/main/scheduleList'
+
+# 가져온 연도별 일정은 CALENDAR_TTL_HOURS 시간(기본값 24)이 지나면 다시 가져옵니다.
+# 아직 올라오지 않은 연도(빈 결과)는 저장하지 않고 EMPTY_TTL 초 뒤에 다시 확인합니다.
+# 가져오지 못한 앞뒤 연도(optional_years)도 EMPTY_TTL 동안은 빈 연도로 봅니다.
+EMPTY_TTL = 3600
+
+# 학사일정 한 건 (start, end 는 date, 하루짜리 일정은 start == end)
+Event = namedtuple('Event', ['start', 'end', 'title'])
+
+
+def parse_events(items):
+    events = []
+    for item in items:
+        try:
+            start = datetime.strptime(item['frdt'], "%Y-%m-%d").date()
+            title = item['title']
+        except (KeyError, TypeError, ValueError):
+            continue  # 날짜 형식이 맞지 않거나 키가 없을 경우 건너뜀
+
+        try:
+            end = datetime.strptime(item['todt'], "%Y-%m-%d").date()
+        except (KeyError, TypeError, ValueError):
+            end = start
+        if end < start:
+            end = start
+
+        events.append(Event(start, end, title))
+    return events
+
+
+class CalendarStore:
+    # 시작일 순으로 정렬해 두고 이분 탐색으로 기간 조회를 합니다.
+    def __init__(self, events):
+        self.events = sorted(events)
+        self.starts = [event.start for event in self.events]
+        # 가장 긴 일정 길이만큼 앞에서부터 보면 겹치는 일정을 모두 찾을 수 있습니다.
+        self.max_span = max((event.end - event.start for event in self.events), default=timedelta(0))
+
+    def starting_between(self, first_day, last_day):
+        # 시작일이 first_day ~ last_day 안에 있는 일정
+        lo = bisect_left(self.starts, first_day)
+        hi = bisect_right(self.starts, last_day)
+        return self.events[lo:hi]
+
+    def overlapping(self, first_day, last_day):
+        # first_day ~ last_day 와 하루라도 겹치는 일정 (여러 날짜 일정 포함)
+        lo = bisect_left(self.starts, first_day - self.max_span)
+        hi = bisect_right(self.starts, last_day)
+        return [event for event in self.events[lo:hi] if event.end >= first_day]
+
+    def next_event(self, keyword, today):
+        # 오늘 진행 중이거나 앞으로 있을 일정 중 keyword가 들어간 가장 가까운 일정
+        lo = bisect_left(self.starts, today - self.max_span)
+        for event in self.events[lo:]:
+            if event.end >= today and keyword in event.title:
+                return event
+        return None
+
+
+def fetch_year(year):
+    params = {
+        "libType": "D",  # 기본값으로 설정
+        "searchDt": f"{year}-01",  # 1월부터 한 해 전체를 받아옵니다.
+        "hakgi": "0",  # 기본값으로 설정
+        "recordCnt": 999,
+        "year": year  # 요청할 연도
+    }
+    response = requests.get(SCHEDULE_URL, params=params)
+    response.raise_for_status()  # 오류가 있을 경우 예외 발생
+    schedule_data = response.json()
+
+    # 요청한 연도에 시작하거나 끝나는 일정만 남깁니다. (12월에 시작해 1월에 끝나는 일정 포함)
+    prefix = f"{year}-"
+    return [item for item in schedule_data.get('list') or []
+            if str(item.get('frdt', '')).startswith(prefix) or str(item.get('todt', '')).startswith(prefix)]
+
+
+# 연도 -> (다시 가져올 시각, 일정 목록)
+_years = {}
+_stores = {}
+# 가져오지 못한 앞뒤 연도 -> 다시 시도할 시각
+_failed_years = {}
+# 빈 연도는 항상 같은 목록을 돌려줘 get_calendar 의 캐시가 그대로 쓰이게 합니다.
+_NO_ITEMS = []
+
+
+def _ttl():
+    return float(os.environ.get('CALENDAR_TTL_HOURS', '24')) * 3600
+
+
+def _load_year(year, required=True):
+    # 컨테이너 안에서는 TTL 동안 연도별로 한 번만 가져옵니다.
+    # CALENDAR_FILE_KEY 가 설정되어 있으면 가져온 시각과 함께 저장소에 보관해 두고,
+    # TTL 안이면 다른 컨테이너도 네트워크 없이 읽습니다.
+    # required 가 아니면 가져오지 못해도 오류 대신 빈 목록을 돌려줍니다.
+    now = time.time()
+    cached = _years.get(year)
+    if cached and cached[0] > now:
+        return cached[1]
+    if not required and _failed_years.get(year, 0) > now:
+        return _NO_ITEMS
+
+    file_key = os.environ.get('CALENDAR_FILE_KEY')
+    storage = get_storage() if file_key else None
+    stale_items = cached[1] if cached else None
+
+    if storage:
+        try:
+            stored = json.loads(storage.read(f"{file_key}-{year}.json"))
+            expires_at = stored['fetched_at'] + _ttl()
+            if expires_at > now:
+                _years[year] = (expires_at, stored['items'])
+                return stored['items']
+            stale_items = stored['items']
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    try:
+        items = fetch_year(year)
+    except (requests.exceptions.RequestException, ValueError):
+        # 다시 가져오지 못하면 예전 일정이라도 보여 줍니다.
+        if stale_items is None:
+            if required:
+                raise
+            _failed_years[year] = now + EMPTY_TTL
+            return _NO_ITEMS
+        _years[year] = (now + EMPTY_TTL, stale_items)
+        return stale_items
+
+    _failed_years.pop(year, None)
+    if not items and stale_items:
+        # 일정이 있던 연도가 비어서 오면 사이트 오류일 수 있으므로 예전 일정을 계속 씁니다.
+        _years[year] = (now + EMPTY_TTL, stale_items)
+        return stale_items
+
+    if items:
+        _years[year] = (now + _ttl(), items)
+        if storage:
+            body = {"fetched_at": now, "items": items}
+            storage.write(f"{file_key}-{year}.json", json.dumps(body, ensure_ascii=False))
+    else:
+        _years[year] = (now + EMPTY_TTL, items)
+    return items
+
+
+def get_calendar(*years, optional_years=()):
+    # 요청한 연도들의 일정을 합친 CalendarStore를 돌려줍니다.
+    # 연도 데이터가 새로 바뀌었을 때만 다시 만듭니다.
+    # years 를 가져오지 못하면 requests.exceptions.RequestException 또는 ValueError가 발생합니다.
+    # optional_years(앞뒤 연도 등)는 가져오지 못하면 빈 연도로 봅니다.
+    required = set(years)
+    key = tuple(sorted(required | set(optional_years)))
+    item_lists = [_load_year(year, year in required) for year in key]
+
+    cached = _stores.get(key)
+    if cached and all(old is new for old, new in zip(cached[0], item_lists)):
+        return cached[1]
+
+    events = set()
+    for items in item_lists:
+        # 두 해에 걸친 일정은 양쪽 연도에 모두 들어 있으므로 한 번만 남깁니다.
+        events.update(parse_events(items))
+    store = CalendarStore(events)
+    _stores[key] = (item_lists, store)
+    return store
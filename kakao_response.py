@@ -0,0 +1,129 @@
+import json
+
+# 카카오 i 오픈빌더 스킬 응답 제한
+# 길이는 카카오와 같이 글자 수 기준으로 셉니다.
+SIMPLE_TEXT_MAX = 1000      # simpleText.text
+ITEM_CARD_TITLE_MAX = 400   # itemCard.title (여러 줄 메뉴를 담는 용도로 잡은 예산)
+ITEM_LIST_MAX = 10          # itemCard.itemList 항목 수
+CAROUSEL_MAX = 10           # carousel.items 카드 수
+OUTPUTS_MAX = 3             # template.outputs 개수
+
+# 제한 때문에 내용을 잘라 낼 때 붙이는 안내문
+TRUNCATED_NOTICE = "(내용이 길어 일부만 표시했어요. 전체 내용은 바로가기에서 확인해 주세요.)"
+TRUNCATED_TEXT_NOTICE = "(내용이 길어 일부만 표시했어요.)"
+
+DEFAULT_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+}
+
+
+def _pack(parts, max_length, separator):
+    # 각 조각의 길이를 한 번만 재고, max_length를 넘지 않도록 차례로 묶습니다.
+    chunks = []
+    current = []
+    current_length = 0
+    separator_length = len(separator)
+
+    for part in parts:
+        part_length = len(part)
+        added_length = part_length + (separator_length if current else 0)
+        if current and current_length + added_length > max_length:
+            chunks.append(separator.join(current))
+            current = [part]
+            current_length = part_length
+        else:
+            current.append(part)
+            current_length += added_length
+
+    if current:
+        chunks.append(separator.join(current))
+
+    return chunks
+
+
+def split_text(text, max_length=SIMPLE_TEXT_MAX, separator='\n'):
+    # 줄 단위로 나누고, 한 줄이 너무 길면 max_length 단위로 자릅니다.
+    parts = []
+    for part in text.split(separator):
+        if len(part) > max_length:
+            parts.extend(part[i:i + max_length] for i in range(0, len(part), max_length))
+        else:
+            parts.append(part)
+    return _pack(parts, max_length, separator)
+
+
+def split_sections(text, max_length):
+    # 빈 줄로 구분된 구역(조식/중식/석식 등)을 최대한 나누지 않고 묶습니다.
+    parts = []
+    for section in text.split('\n\n'):
+        if len(section) > max_length:
+            parts.extend(split_text(section, max_length))
+        else:
+            parts.append(section)
+    return _pack(parts, max_length, '\n\n')
+
+
+def _truncate(text, max_length, notice):
+    # 잘린 내용이 있다는 안내문이 들어갈 자리를 남기고 줄 단위로 자릅니다.
+    kept = split_text(text, max_length - len(notice) - 2)[0]
+    return f"{kept}\n\n{notice}"
+
+
+def text_outputs(text, max_outputs=OUTPUTS_MAX, more_url=None):
+    # 긴 텍스트는 여러 개의 simpleText 말풍선으로 나눕니다.
+    # 말풍선 수를 넘으면 마지막 말풍선에 잘렸다는 안내(와 more_url)를 붙입니다.
+    chunks = split_text(text, SIMPLE_TEXT_MAX)
+    if len(chunks) > max_outputs:
+        notice = TRUNCATED_TEXT_NOTICE if more_url is None else f"{TRUNCATED_TEXT_NOTICE}\n전체 보기: {more_url}"
+        chunks = chunks[:max_outputs]
+        chunks[-1] = _truncate(chunks[-1], SIMPLE_TEXT_MAX, notice)
+    return [{"simpleText": {"text": chunk}} for chunk in chunks]
+
+
+def item_card_outputs(card):
+    # itemList가 10개를 넘으면 항목을 나눠 담은 카드들의 carousel로 보냅니다.
+    # title이 길면 첫 카드에는 앞부분만 두고 나머지는 뒤따르는 simpleText로 보냅니다.
+    # 모든 내용은 한 번씩만 들어갑니다.
+    titles = split_sections(card['title'], ITEM_CARD_TITLE_MAX) if card.get('title') else []
+    item_list = card.get('itemList', [])
+    item_chunks = [item_list[i:i + ITEM_LIST_MAX] for i in range(0, len(item_list), ITEM_LIST_MAX)] or [item_list]
+    more_url = next((button['webLinkUrl'] for button in card.get('buttons', []) if 'webLinkUrl' in button), None)
+
+    if len(titles) <= 1 and len(item_chunks) == 1:
+        return [{"itemCard": card}]
+
+    cards = []
+    for index, items in enumerate(item_chunks):
+        split_card = dict(card)
+        split_card.pop('title', None)
+        if index == 0 and titles:
+            split_card['title'] = titles[0]
+        split_card['itemList'] = items
+        cards.append(split_card)
+
+    if len(cards) > CAROUSEL_MAX:
+        cards = cards[:CAROUSEL_MAX]
+        # 남은 항목은 카드의 바로가기 버튼에서 볼 수 있다고 알려 줍니다.
+        cards[-1]['title'] = TRUNCATED_NOTICE if 'title' not in cards[-1] else f"{cards[-1]['title']}\n\n{TRUNCATED_NOTICE}"
+
+    if len(cards) == 1:
+        outputs = [{"itemCard": cards[0]}]
+    else:
+        outputs = [{"carousel": {"type": "itemCard", "items": cards}}]
+
+    if len(titles) > 1:
+        outputs.extend(text_outputs('\n\n'.join(titles[1:]), OUTPUTS_MAX - 1, more_url))
+
+    return outputs
+
+
+def lambda_response(result, status_code=200, headers=None):
+    # 응답 본문은 여기서 한 번만 직렬화합니다.
+    response_headers = dict(DEFAULT_HEADERS)
+    if headers:
+        response_headers.update(headers)
+    return {
+        'statusCode': status_code,
+        'body': json.dumps(result, ensure_ascii=False),
+        'headers': response_headers,
+    }
@@ -0,0 +1,118 @@
+import re
+import json
+from collections import namedtuple
+from bs4 import BeautifulSoup, SoupStrainer
+
+# 식단표(todayMenu1, todayMenu2) 표 추출
+# <tr> 를 한 번만 훑어 날짜 x 식사 격자를 만들고, 저장소에는 격자 그대로 JSON 으로 올립니다.
+# 핸들러는 격자의 by_date 색인으로 (월, 일, 식사)를 바로 찾습니다.
+
+MEAL_NAMES = ['조식', '중식', '석식']
+
+# 예: "3/4", "03/04(월)", "3.4 화"
+DATE_RE = re.compile(r'(\d{1,2})\s*[/.]\s*(\d{1,2})')
+WEEKDAY_RE = re.compile(r'[월화수목금토일]')
+
+# 하루치 식단 (meals 는 MenuGrid.meal_names 와 같은 길이)
+MenuDay = namedtuple('MenuDay', ['label', 'month', 'day', 'weekday', 'meals'])
+# 날짜 x 식사 격자 (by_date: (월, 일) -> MenuDay)
+MenuGrid = namedtuple('MenuGrid', ['meal_names', 'days', 'by_date'])
+
+
+def make_menu_grid(meal_names, days):
+    # 같은 날짜가 여러 번 나오면 첫 행만 남깁니다. (저장하고 다시 읽어도 같은 행)
+    by_date = {}
+    for menu_day in days:
+        by_date.setdefault((menu_day.month, menu_day.day), menu_day)
+    return MenuGrid(list(meal_names), list(by_date.values()), by_date)
+
+
+def parse_date(text):
+    # 날짜 칸을 (표시용 라벨, 월, 일, 요일)로 바꿉니다. 날짜가 없으면 None
+    match = DATE_RE.search(text)
+    if not match:
+        return None
+    month, day = int(match.group(1)), int(match.group(2))
+    weekday_match = WEEKDAY_RE.search(text, match.end())
+    weekday = weekday_match.group(0) if weekday_match else ''
+    label = f"{month}/{day} {weekday}" if weekday else f"{month}/{day}"
+    return label, month, day, weekday
+
+
+def extract_menu_grid(html, date_class=None, max_meals=None):
+    # date_class 가 주어지면 첫 칸에 그 class 가 있는 행만 날짜 행으로 봅니다.
+    # max_meals 가 주어지면 날짜 뒤 그 개수만큼의 칸만 식사로 봅니다.
+    # 표 행만 파싱해 페이지의 나머지(메뉴바, 스크립트 등)를 트리로 만드는 비용을 줄입니다.
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('tr'))
+
+    rows = []
+    width = 0
+    for row in soup.find_all('tr'):
+        columns = row.find_all('td')
+        if not columns:
+            continue
+
+        date_td = columns[0]
+        if date_class and date_class not in (date_td.get('class') or []):
+            continue
+
+        date_text = date_td.get_text(' ', strip=True)
+        if "원산지" in date_text:
+            continue
+        parsed = parse_date(date_text)
+        if parsed is None:
+            continue
+
+        meal_tds = columns[1:1 + max_meals] if max_meals else columns[1:]
+        meals = [td.get_text('\n', strip=True).replace('&amp;', '&') for td in meal_tds]
+        width = max(width, len(meals))
+        rows.append((parsed, meals))
+
+    if max_meals:
+        width = max_meals
+    meal_names = MEAL_NAMES[:width] + [f"식사 {index + 1}" for index in range(len(MEAL_NAMES), width)]
+
+    # 칸 수가 모자란 행은 빈 문자열로 채워 직사각형으로 만듭니다.
+    days = [
+        MenuDay(label, month, day, weekday, tuple(meals + [''] * (width - len(meals))))
+        for (label, month, day, weekday), meals in rows
+    ]
+    return make_menu_grid(meal_names, days)
+
+
+def get_meal(grid, month, day, meal_name):
+    # (월, 일, 식사)의 메뉴. 그 날짜가 없거나 없는 식사면 None, 칸이 비어 있으면 ''
+    menu_day = grid.by_date.get((month, day))
+    if menu_day is None or meal_name not in grid.meal_names:
+        return None
+    return menu_day.meals[grid.meal_names.index(meal_name)]
+
+
+def dump_menu_grid(grid):
+    # 저장 형식: {"meal_names": [...], "days": {"월/일": {"label", "weekday", "meals": [...]}}}
+    body = {
+        "meal_names": grid.meal_names,
+        "days": {
+            f"{menu_day.month}/{menu_day.day}": {
+                "label": menu_day.label,
+                "weekday": menu_day.weekday,
+                "meals": list(menu_day.meals),
+            }
+            for menu_day in grid.days
+        },
+    }
+    return json.dumps(body, ensure_ascii=False)
+
+
+def load_menu_grid(text):
+    # dump_menu_grid 로 저장한 격자를 되살립니다. 형식이 다르면(예전 텍스트 형식 등) ValueError
+    try:
+        body = json.loads(text)
+        meal_names = body['meal_names']
+        days = []
+        for key, row in body['days'].items():
+            month, day = (int(part) for part in key.split('/'))
+            days.append(MenuDay(row['label'], month, day, row['weekday'], tuple(row['meals'])))
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid menu grid: {e}")
+    return make_menu_grid(meal_names, days)
@@ -0,0 +1,121 @@
+import os
+import json
+import time
+import pstats
+import cProfile
+import functools
+from storage import get_storage
+
+# 핸들러 프로파일링
+# PROFILE_HANDLERS=1 이거나 스킬 요청 params 에 "debug": "profile" 이 있으면
+# lambda_handler 를 cProfile 로 실행하고 결과를 남깁니다.
+#   PROFILE_DIR      : pstats(.prof)와 collapsed-stack(.collapsed) 파일을 쓸 폴더 (기본값 /tmp/profiles)
+#   PROFILE_FILE_KEY : 설정하면 .prof 와 .collapsed 파일을 저장소의 이 키 아래에도 올립니다.
+#                      (Lambda 의 /tmp 는 실행이 끝나면 사라지므로 모아 볼 때는 이 값을 설정합니다.)
+# 여러 번 모인 .prof 파일은 summarize_profiles.py 로 요약합니다.
+
+
+def profiling_requested(event):
+    if os.environ.get('PROFILE_HANDLERS') == '1':
+        return True
+
+    body = event.get('body') if isinstance(event, dict) else None
+    # 대부분의 요청에는 debug 값이 없으므로 본문을 다시 파싱하기 전에 먼저 확인합니다.
+    if not body or '"debug"' not in body:
+        return False
+    try:
+        params = json.loads(body).get('action', {}).get('params', {})
+    except (json.JSONDecodeError, AttributeError):
+        return False
+    return params.get('debug') == 'profile'
+
+
+def _label(func):
+    filename, lineno, name = func
+    return f"{os.path.basename(filename)}:{lineno}({name})"
+
+
+def collapsed_stacks(stats):
+    # cProfile 은 호출 스택 전체를 남기지 않으므로, 각 함수의 가장 무거운 호출자를 따라가
+    # 스택을 근사합니다. flamegraph.pl, speedscope 에서 바로 열 수 있는 형식입니다.
+    entries = stats.stats
+
+    def heaviest_caller(func):
+        callers = entries[func][4]
+        if not callers:
+            return None
+        return max(callers, key=lambda caller: callers[caller][3])
+
+    paths = {}
+
+    def path_of(func):
+        if func in paths:
+            return paths[func]
+        chain = []
+        seen = set()
+        current = func
+        while current is not None and current not in seen and current in entries:
+            seen.add(current)
+            chain.append(_label(current))
+            current = heaviest_caller(current)
+        paths[func] = ';'.join(reversed(chain))
+        return paths[func]
+
+    lines = []
+    for func, (cc, nc, tt, ct, callers) in entries.items():
+        if not callers:
+            weight = int(tt * 1_000_000)
+            if weight:
+                lines.append(f"{_label(func)} {weight}")
+            continue
+        for caller, caller_stats in callers.items():
+            # caller_stats: (호출 수, 원시 호출 수, 자체 시간, 누적 시간)
+            weight = int(caller_stats[2] * 1_000_000)
+            if weight and caller in entries:
+                lines.append(f"{path_of(caller)};{_label(func)} {weight}")
+
+    return '\n'.join(sorted(lines)) + '\n'
+
+
+def save_profile(profiler, name):
+    profile_dir = os.environ.get('PROFILE_DIR', '/tmp/profiles')
+    os.makedirs(profile_dir, exist_ok=True)
+    base = os.path.join(profile_dir, name)
+
+    profiler.dump_stats(base + '.prof')
+    collapsed = collapsed_stacks(pstats.Stats(profiler))
+    with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+        f.write(collapsed)
+
+    file_key = os.environ.get('PROFILE_FILE_KEY')
+    if file_key:
+        storage = get_storage()
+        with open(base + '.prof', 'rb') as f:
+            storage.write_bytes(f"{file_key}/{name}.prof", f.read())
+        storage.write(f"{file_key}/{name}.collapsed", collapsed)
+
+    return base
+
+
+def profiled(handler):
+    # lambda_handler 에 붙여 사용합니다. 프로파일링을 요청하지 않으면 그대로 호출합니다.
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        if not profiling_requested(event):
+            return handler(event, context)
+
+        profiler = cProfile.Profile()
+        started = time.time()
+        try:
+            return profiler.runcall(handler, event, context)
+        finally:
+            request_id = getattr(context, 'aws_request_id', None) or f"{os.getpid()}"
+            name = f"{handler.__module__}-{int(started * 1000)}-{request_id}".replace(' ', '_')
+            try:
+                base = save_profile(profiler, name)
+                print(f"Profile saved: {base} ({time.time() - started:.3f}s)")
+            except Exception as e:
+                # 프로파일 저장 실패가 응답에 영향을 주지 않도록 합니다.
+                print(f"Error saving profile: {str(e)}")
+
+    return wrapper
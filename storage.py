@@ -0,0 +1,250 @@
+import os
+import time
+import sqlite3
+
+# 저장소 백엔드
+# STORAGE_BACKEND 환경 변수로 선택합니다.
+#   s3     : S3에서 직접 읽고 씁니다. (기본값)
+#   local  : STORAGE_DIR 아래 파일로 읽고 씁니다.
+#   sqlite : STORAGE_DB_PATH 의 SQLite 파일로 읽고 씁니다.
+#   cached : 컨테이너 안의 SQLite에서 먼저 읽고, S3는 영구 보관용으로만 사용합니다.
+#            STORAGE_CACHE_TTL 초(기본값 600)가 지난 로컬 사본은 S3에서 다시 받아옵니다.
+# 파일이 없을 때는 모든 백엔드가 기존 read_s3_file 과 같이 ValueError를 발생시킵니다.
+# refresh(file_key) 는 캐시를 건너뛰고 원본에서 다시 읽습니다. (cached 외에는 read 와 같습니다.)
+# read_bytes / write_bytes 는 프로파일 같은 바이너리 파일용이고, list_keys(prefix) 는 키 목록을 돌려줍니다.
+# 식단표 핸들러는 서로 다른 키에 저장합니다. (같은 버킷/폴더를 써도 덮어쓰지 않도록)
+#   MENU1_FILE_KEY : 식당 메뉴 불러오기.py 의 todayMenu1 격자 (기본값 todayMenu1.json)
+#   MENU2_FILE_KEY : 학생회관 메뉴 불러오기.py 의 todayMenu2 격자 (기본값 todayMenu2.json)
+
+DEFAULT_BUCKET = 'Private'
+
+
+class S3Storage:
+    def __init__(self, bucket_name):
+        self.bucket_name = bucket_name
+        self._client = None
+
+    @property
+    def client(self):
+        # boto3 클라이언트는 한 번만 만들고 웜 컨테이너에서 재사용합니다.
+        # AWS 없이도 다른 백엔드를 쓸 수 있도록 boto3는 필요할 때 불러옵니다.
+        if self._client is None:
+            import boto3
+            self._client = boto3.client('s3')
+        return self._client
+
+    def read(self, file_key):
+        try:
+            obj = self.client.get_object(Bucket=self.bucket_name, Key=file_key)
+            return obj['Body'].read().decode('utf-8')
+        except self.client.exceptions.NoSuchKey:
+            raise ValueError(f"The file {file_key} does not exist in the bucket {self.bucket_name}.")
+
+    def refresh(self, file_key):
+        return self.read(file_key)
+
+    def write(self, file_key, body):
+        self.client.put_object(Bucket=self.bucket_name, Key=file_key, Body=body.encode('utf-8'),
+                               ContentType='text/plain; charset=utf-8')
+
+    def read_bytes(self, file_key):
+        try:
+            obj = self.client.get_object(Bucket=self.bucket_name, Key=file_key)
+            return obj['Body'].read()
+        except self.client.exceptions.NoSuchKey:
+            raise ValueError(f"The file {file_key} does not exist in the bucket {self.bucket_name}.")
+
+    def write_bytes(self, file_key, body):
+        self.client.put_object(Bucket=self.bucket_name, Key=file_key, Body=body,
+                               ContentType='application/octet-stream')
+
+    def list_keys(self, prefix=''):
+        keys = []
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []))
+        return sorted(keys)
+
+
+class LocalStorage:
+    def __init__(self, bucket_name, base_dir):
+        self.bucket_name = bucket_name
+        self.base_dir = os.path.join(base_dir, bucket_name)
+
+    def _path(self, file_key):
+        return os.path.join(self.base_dir, file_key)
+
+    def read(self, file_key):
+        try:
+            with open(self._path(file_key), encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise ValueError(f"The file {file_key} does not exist in the bucket {self.bucket_name}.")
+
+    def refresh(self, file_key):
+        return self.read(file_key)
+
+    def write(self, file_key, body):
+        path = self._path(file_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 쓰는 도중에 읽히지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    def read_bytes(self, file_key):
+        try:
+            with open(self._path(file_key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise ValueError(f"The file {file_key} does not exist in the bucket {self.bucket_name}.")
+
+    def write_bytes(self, file_key, body):
+        path = self._path(file_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    def list_keys(self, prefix=''):
+        keys = []
+        for root, _, names in os.walk(self.base_dir):
+            for name in names:
+                key = os.path.relpath(os.path.join(root, name), self.base_dir).replace(os.sep, '/')
+                if key.startswith(prefix) and not key.endswith('.tmp'):
+                    keys.append(key)
+        return sorted(keys)
+
+
+class SQLiteStorage:
+    def __init__(self, bucket_name, db_path):
+        self.bucket_name = bucket_name
+        self.db_path = db_path
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " bucket TEXT NOT NULL,"
+                " file_key TEXT NOT NULL,"
+                " body TEXT NOT NULL,"
+                " PRIMARY KEY (bucket, file_key))"
+            )
+        return self._conn
+
+    def read(self, file_key):
+        row = self.conn.execute(
+            "SELECT body FROM files WHERE bucket = ? AND file_key = ?",
+            (self.bucket_name, file_key)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"The file {file_key} does not exist in the bucket {self.bucket_name}.")
+        return row[0]
+
+    def refresh(self, file_key):
+        return self.read(file_key)
+
+    def write(self, file_key, body):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (bucket, file_key, body) VALUES (?, ?, ?)",
+                (self.bucket_name, file_key, body)
+            )
+
+    def read_bytes(self, file_key):
+        body = self.read(file_key)
+        return body if isinstance(body, bytes) else body.encode('utf-8')
+
+    def write_bytes(self, file_key, body):
+        # bytes 는 BLOB 으로 그대로 저장됩니다.
+        self.write(file_key, bytes(body))
+
+    def list_keys(self, prefix=''):
+        rows = self.conn.execute(
+            "SELECT file_key FROM files WHERE bucket = ? AND substr(file_key, 1, ?) = ? ORDER BY file_key",
+            (self.bucket_name, len(prefix), prefix)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+
+class CachedStorage:
+    def __init__(self, local, remote, ttl=600):
+        self.local = local
+        self.remote = remote
+        self.ttl = ttl
+        self._synced_at = {}
+
+    def read(self, file_key):
+        # 이 컨테이너에서 ttl 안에 S3와 맞춰 본 사본만 로컬에서 바로 읽습니다.
+        synced_at = self._synced_at.get(file_key)
+        if synced_at is not None and time.time() - synced_at < self.ttl:
+            try:
+                return self.local.read(file_key)
+            except ValueError:
+                pass
+        try:
+            return self.refresh(file_key)
+        except ValueError:
+            raise
+        except Exception:
+            # S3에 닿지 않으면 오래된 로컬 사본이라도 돌려줍니다.
+            return self.local.read(file_key)
+
+    def refresh(self, file_key):
+        # S3에서 다시 받아 로컬 사본을 갱신합니다. (다른 컨테이너가 올린 내용 반영)
+        body = self.remote.read(file_key)
+        self.local.write(file_key, body)
+        self._synced_at[file_key] = time.time()
+        return body
+
+    def write(self, file_key, body):
+        self.remote.write(file_key, body)
+        self.local.write(file_key, body)
+        self._synced_at[file_key] = time.time()
+
+    # 바이너리 파일과 목록은 자주 읽지 않으므로 S3를 그대로 사용합니다.
+    def read_bytes(self, file_key):
+        return self.remote.read_bytes(file_key)
+
+    def write_bytes(self, file_key, body):
+        self.remote.write_bytes(file_key, body)
+
+    def list_keys(self, prefix=''):
+        return self.remote.list_keys(prefix)
+
+
+_storages = {}
+
+
+def get_storage(bucket_name=None):
+    # 환경 변수에 따라 저장소를 만들고, 같은 컨테이너 안에서는 재사용합니다.
+    if bucket_name is None:
+        bucket_name = os.environ.get('STORAGE_BUCKET', DEFAULT_BUCKET)
+    backend = os.environ.get('STORAGE_BACKEND', 's3')
+
+    cache_key = (backend, bucket_name)
+    if cache_key in _storages:
+        return _storages[cache_key]
+
+    if backend == 's3':
+        storage = S3Storage(bucket_name)
+    elif backend == 'local':
+        storage = LocalStorage(bucket_name, os.environ.get('STORAGE_DIR', '/tmp/storage'))
+    elif backend == 'sqlite':
+        storage = SQLiteStorage(bucket_name, os.environ.get('STORAGE_DB_PATH', '/tmp/storage.db'))
+    elif backend == 'cached':
+        local = SQLiteStorage(bucket_name, os.environ.get('STORAGE_DB_PATH', '/tmp/storage.db'))
+        storage = CachedStorage(local, S3Storage(bucket_name), int(os.environ.get('STORAGE_CACHE_TTL', '600')))
+    else:
+        raise ValueError(f"Unknown storage backend: {backend}")
+
+    _storages[cache_key] = storage
+    return storage
@@ -0,0 +1,74 @@
+import os
+import sys
+import pstats
+import argparse
+import tempfile
+from storage import get_storage
+
+# profiling.py 로 모은 .prof 파일들을 합쳐 오래 걸린 함수를 보여줍니다.
+# 예: python summarize_profiles.py /tmp/profiles --sort cumulative --limit 30
+# Lambda 에서 PROFILE_FILE_KEY 아래로 올린 파일은 저장소에서 받아 요약합니다.
+# 예: STORAGE_BACKEND=s3 STORAGE_BUCKET=... python summarize_profiles.py --storage profiles
+
+
+def find_profiles(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.prof'))
+        else:
+            files.append(path)
+    return files
+
+
+def download_profiles(prefix, target_dir):
+    # 저장소(STORAGE_BACKEND)에서 prefix 아래의 .prof 파일을 target_dir 로 받아옵니다.
+    storage = get_storage()
+    files = []
+    for key in storage.list_keys(prefix):
+        if not key.endswith('.prof'):
+            continue
+        path = os.path.join(target_dir, key.replace('/', '_'))
+        with open(path, 'wb') as f:
+            f.write(storage.read_bytes(key))
+        files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 번 저장된 핸들러 프로파일을 요약합니다.")
+    parser.add_argument('paths', nargs='*',
+                        help=".prof 파일 또는 .prof 파일이 있는 폴더 (기본값 PROFILE_DIR 또는 /tmp/profiles)")
+    parser.add_argument('--storage', metavar='PREFIX', default=None,
+                        help="저장소의 PREFIX 아래 .prof 파일도 함께 요약 (profiling.py 의 PROFILE_FILE_KEY)")
+    parser.add_argument('--sort', default='tottime', choices=['tottime', 'cumulative', 'ncalls'],
+                        help="정렬 기준 (기본값 tottime)")
+    parser.add_argument('--limit', type=int, default=20, help="보여줄 함수 개수")
+    parser.add_argument('--filter', default=None, help="함수 이름/경로에 들어간 문자열로 거르기 (예: bs4, json)")
+    args = parser.parse_args()
+
+    paths = args.paths
+    if not paths and args.storage is None:
+        paths = [os.environ.get('PROFILE_DIR', '/tmp/profiles')]
+
+    with tempfile.TemporaryDirectory() as download_dir:
+        files = find_profiles(paths)
+        if args.storage is not None:
+            files.extend(download_profiles(args.storage, download_dir))
+        if not files:
+            print("프로파일 파일을 찾을 수 없습니다.")
+            return 1
+
+        # pstats 는 파일을 바로 읽어 들이므로 임시 폴더가 지워지기 전에 합칩니다.
+        stats = pstats.Stats(*files)
+
+    print(f"{len(files)}개 실행 결과 합계, 전체 {stats.total_tt:.3f}s")
+
+    stats.strip_dirs().sort_stats(args.sort)
+    restrictions = [args.filter, args.limit] if args.filter else [args.limit]
+    stats.print_stats(*restrictions)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
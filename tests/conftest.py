@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 핸들러 옆의 공용 모듈(storage, kakao_response 등)을 불러올 수 있도록 저장소 루트를 경로에 추가합니다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,150 @@
+from datetime import date
+
+import pytest
+import requests
+
+import calendar_store
+import storage
+from calendar_store import CalendarStore, Event, get_calendar, parse_events
+
+ITEMS = {
+    2025: [
+        {"frdt": "2025-12-22", "todt": "2026-01-02", "title": "겨울 계절학기"},
+        {"frdt": "2025-12-15", "todt": "2025-12-19", "title": "기말고사"},
+    ],
+    2026: [
+        {"frdt": "2025-12-22", "todt": "2026-01-02", "title": "겨울 계절학기"},
+        {"frdt": "2026-03-02", "todt": "2026-03-02", "title": "개강"},
+        {"frdt": "2026-04-20", "todt": "2026-04-24", "title": "중간고사"},
+        {"frdt": "2026-06-15", "todt": "2026-06-19", "title": "기말고사"},
+        {"frdt": "bad", "title": "날짜 오류"},
+    ],
+    2027: [],
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(calendar_store, '_years', {})
+    monkeypatch.setattr(calendar_store, '_stores', {})
+    monkeypatch.setattr(calendar_store, '_failed_years', {})
+    monkeypatch.setattr(storage, '_storages', {})
+    monkeypatch.setenv('STORAGE_BACKEND', 'sqlite')
+    monkeypatch.setenv('STORAGE_DB_PATH', str(tmp_path / 'storage.db'))
+    monkeypatch.delenv('CALENDAR_FILE_KEY', raising=False)
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = []
+
+    def fake_fetch_year(year):
+        calls.append(year)
+        return [dict(item) for item in ITEMS.get(year, [])]
+
+    monkeypatch.setattr(calendar_store, 'fetch_year', fake_fetch_year)
+    return calls
+
+
+def test_parse_events_handles_missing_and_reversed_dates():
+    events = parse_events([
+        {"frdt": "2026-03-02", "title": "개강"},
+        {"frdt": "2026-03-05", "todt": "2026-03-01", "title": "거꾸로"},
+        {"frdt": "bad", "title": "날짜 오류"},
+        {"todt": "2026-03-01", "title": "시작일 없음"},
+    ])
+    assert events == [
+        Event(date(2026, 3, 2), date(2026, 3, 2), "개강"),
+        Event(date(2026, 3, 5), date(2026, 3, 5), "거꾸로"),
+    ]
+
+
+def test_store_queries():
+    store = CalendarStore(parse_events(ITEMS[2026]))
+    assert [e.title for e in store.starting_between(date(2026, 4, 1), date(2026, 4, 30))] == ["중간고사"]
+    # 4/22 하루만 물어봐도 4/20~4/24 일정과 겹칩니다.
+    assert [e.title for e in store.overlapping(date(2026, 4, 22), date(2026, 4, 22))] == ["중간고사"]
+    assert store.next_event("기말", date(2026, 4, 22)).start == date(2026, 6, 15)
+    assert store.next_event("중간", date(2026, 4, 22)).start == date(2026, 4, 20)
+    assert store.next_event("중간", date(2026, 4, 25)) is None
+
+
+def test_year_is_fetched_once_within_ttl(fetches):
+    get_calendar(2026)
+    get_calendar(2026)
+    assert fetches == [2026]
+
+
+def test_year_is_refetched_after_ttl(fetches, monkeypatch):
+    get_calendar(2026)
+    monkeypatch.setenv('CALENDAR_TTL_HOURS', '0')
+    monkeypatch.setattr(calendar_store, '_years', {year: (0, items) for year, (_, items) in calendar_store._years.items()})
+    get_calendar(2026)
+    assert fetches == [2026, 2026]
+
+
+def test_stored_year_is_reused_and_refreshed(fetches, monkeypatch):
+    monkeypatch.setenv('CALENDAR_FILE_KEY', 'schedule')
+    get_calendar(2026)
+
+    # 새 컨테이너: 저장소에 TTL 안의 사본이 있으면 가져오지 않습니다.
+    monkeypatch.setattr(calendar_store, '_years', {})
+    get_calendar(2026)
+    assert fetches == [2026]
+
+    # TTL이 지나면 다시 가져옵니다.
+    monkeypatch.setattr(calendar_store, '_years', {})
+    monkeypatch.setenv('CALENDAR_TTL_HOURS', '0')
+    get_calendar(2026)
+    assert fetches == [2026, 2026]
+
+
+def test_empty_year_is_not_stored(fetches, monkeypatch):
+    monkeypatch.setenv('CALENDAR_FILE_KEY', 'schedule')
+    get_calendar(2027)
+    with pytest.raises(ValueError):
+        storage.get_storage().read('schedule-2027.json')
+
+
+def test_stale_year_is_served_when_refetch_fails(fetches, monkeypatch):
+    get_calendar(2026)
+    monkeypatch.setattr(calendar_store, '_years', {year: (0, items) for year, (_, items) in calendar_store._years.items()})
+
+    def broken_fetch_year(year):
+        raise requests.exceptions.ConnectionError('network down')
+
+    monkeypatch.setattr(calendar_store, 'fetch_year', broken_fetch_year)
+    assert get_calendar(2026).next_event("기말", date(2026, 4, 1)).title == "기말고사"
+
+
+def test_event_across_new_year_is_found_once(fetches):
+    store = get_calendar(2025, 2026)
+    events = store.overlapping(date(2026, 1, 1), date(2026, 1, 7))
+    assert [e.title for e in events] == ["겨울 계절학기"]
+
+
+def test_failed_optional_year_is_treated_as_empty(fetches, monkeypatch):
+    def fetch_year_without_2027(year):
+        if year == 2027:
+            raise requests.exceptions.ConnectionError('network down')
+        fetches.append(year)
+        return [dict(item) for item in ITEMS.get(year, [])]
+
+    monkeypatch.setattr(calendar_store, 'fetch_year', fetch_year_without_2027)
+    store = get_calendar(2026, optional_years=[2025, 2027])
+    assert store.next_event("기말", date(2026, 4, 1)).start == date(2026, 6, 15)
+
+    # 실패한 연도는 EMPTY_TTL 동안 다시 가져오지 않습니다.
+    assert get_calendar(2026, optional_years=[2025, 2027]) is store
+    assert fetches == [2025, 2026]
+
+    # 같은 연도라도 꼭 필요한 연도로 물으면 오류를 그대로 알립니다.
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_calendar(2027)
+
+
+def test_stale_year_is_kept_when_refetch_comes_back_empty(fetches, monkeypatch):
+    get_calendar(2026)
+    monkeypatch.setattr(calendar_store, '_years', {year: (0, items) for year, (_, items) in calendar_store._years.items()})
+    monkeypatch.setattr(calendar_store, 'fetch_year', lambda year: [])
+    assert get_calendar(2026).next_event("기말", date(2026, 4, 1)).title == "기말고사"
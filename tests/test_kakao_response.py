@@ -0,0 +1,178 @@
+import json
+
+from kakao_response import (
+    CAROUSEL_MAX,
+    ITEM_CARD_TITLE_MAX,
+    ITEM_LIST_MAX,
+    OUTPUTS_MAX,
+    SIMPLE_TEXT_MAX,
+    TRUNCATED_NOTICE,
+    TRUNCATED_TEXT_NOTICE,
+    item_card_outputs,
+    lambda_response,
+    split_sections,
+    split_text,
+    text_outputs,
+)
+
+MENU_URL = "https://www.mmu.ac.kr/main/contents/todayMenu1"
+
+
+def worst_case_menu_title(lines_per_meal=30):
+    # 식사마다 긴 메뉴가 잔뜩 올라온 날 (ITEM_CARD_TITLE_MAX 를 크게 넘김)
+    meal = "\n".join(f"돼지고기김치찌개&계란말이&멸치볶음 {n}" for n in range(lines_per_meal))
+    return "\n\n".join([f"🌅조식\n{meal}", f"🖼️중식\n{meal}", f"🌆석식\n{meal}"])
+
+
+def menu_card(title):
+    return {
+        "imageTitle": {"title": "03월 04일 월요일", "description": "오늘의 학생회관 식당 메뉴"},
+        "title": title,
+        "itemList": [
+            {"title": "조식 ⏰", "description": "08:00 ~ 09:00"},
+            {"title": "중식 ⏰", "description": "11:30 ~ 13:30"},
+            {"title": "석식 ⏰", "description": "17:30 ~ 18:30"},
+        ],
+        "buttons": [{"action": "webLink", "label": "전체 메뉴 보러가기", "webLinkUrl": MENU_URL}],
+        "itemListAlignment": "right",
+    }
+
+
+def notice_card(count):
+    return {
+        "imageTitle": {"title": "해성공지", "description": "일반공지는 최근 4~7개 내역만 불러옵니다."},
+        "itemList": [{"title": "일반공지", "description": f"공지 {n} 03-04"} for n in range(count)],
+        "buttons": [{"label": "해성공지 바로가기", "action": "webLink", "webLinkUrl": "https://www.mmu.ac.kr/main/board/301"}],
+    }
+
+
+def output_texts(outputs):
+    texts = []
+    for output in outputs:
+        if 'itemCard' in output:
+            texts.append(output['itemCard'].get('title', ''))
+        elif 'carousel' in output:
+            texts.extend(card.get('title', '') for card in output['carousel']['items'])
+        else:
+            texts.append(output['simpleText']['text'])
+    return texts
+
+
+def test_split_text_keeps_short_text_whole():
+    assert split_text("쌀밥\n미역국", 100) == ["쌀밥\n미역국"]
+
+
+def test_split_text_respects_limit_and_order():
+    text = "\n".join(f"메뉴 {n}" for n in range(500))
+    chunks = split_text(text, 100)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "\n".join(chunks) == text
+
+
+def test_split_text_cuts_line_longer_than_limit():
+    line = "가" * (SIMPLE_TEXT_MAX * 2 + 10)
+    chunks = split_text(line, SIMPLE_TEXT_MAX)
+    assert [len(chunk) for chunk in chunks] == [SIMPLE_TEXT_MAX, SIMPLE_TEXT_MAX, 10]
+    assert "".join(chunks) == line
+
+
+def test_split_sections_keeps_meals_together_when_they_fit():
+    title = "🌅조식\n쌀밥\n\n🖼️중식\n라면\n\n🌆석식\n김밥"
+    assert split_sections(title, 10) == ["🌅조식\n쌀밥", "🖼️중식\n라면", "🌆석식\n김밥"]
+    assert split_sections(title, ITEM_CARD_TITLE_MAX) == [title]
+
+
+def test_split_sections_splits_oversized_meal():
+    title = worst_case_menu_title()
+    chunks = split_sections(title, ITEM_CARD_TITLE_MAX)
+    assert len(chunks) > 3
+    assert all(len(chunk) <= ITEM_CARD_TITLE_MAX for chunk in chunks)
+
+
+def test_text_outputs_splits_into_bubbles():
+    text = "\n".join(f"2026-03-{n % 28 + 1:02d} : 학사일정 {n}" for n in range(80))
+    outputs = text_outputs(text)
+    assert 1 < len(outputs) <= OUTPUTS_MAX
+    assert all(len(output['simpleText']['text']) <= SIMPLE_TEXT_MAX for output in outputs)
+    assert "\n".join(output['simpleText']['text'] for output in outputs) == text
+
+
+def test_text_outputs_marks_truncation():
+    text = "\n".join(f"2026-03-01 ~ 2026-03-02 : 아주 긴 학사일정 제목 {n}" for n in range(1000))
+    outputs = text_outputs(text, more_url=MENU_URL)
+    assert len(outputs) == OUTPUTS_MAX
+    last = outputs[-1]['simpleText']['text']
+    assert len(last) <= SIMPLE_TEXT_MAX
+    assert TRUNCATED_TEXT_NOTICE in last
+    assert MENU_URL in last
+
+
+def test_item_card_outputs_leaves_small_card_alone():
+    card = menu_card("🌅조식\n쌀밥\n\n🖼️중식\n라면\n\n🌆석식\n김밥")
+    assert item_card_outputs(card) == [{"itemCard": card}]
+
+
+def test_item_card_outputs_worst_case_menu_fits_limits_once():
+    title = worst_case_menu_title(lines_per_meal=20)
+    assert len(title) > ITEM_CARD_TITLE_MAX * 3
+
+    outputs = item_card_outputs(menu_card(title))
+    assert 1 < len(outputs) <= OUTPUTS_MAX
+
+    card = outputs[0]['itemCard']
+    assert len(card['title']) <= ITEM_CARD_TITLE_MAX
+    assert len(card['itemList']) == 3
+    for output in outputs[1:]:
+        assert len(output['simpleText']['text']) <= SIMPLE_TEXT_MAX
+
+    # 모든 메뉴 줄이 빠짐없이, 한 번씩만 나옵니다.
+    shown = "\n".join(output_texts(outputs))
+    assert sorted(line for line in shown.split("\n") if line) == sorted(line for line in title.split("\n") if line)
+
+
+def test_item_card_outputs_truncated_menu_links_to_full_page():
+    outputs = item_card_outputs(menu_card(worst_case_menu_title(lines_per_meal=200)))
+    assert len(outputs) == OUTPUTS_MAX
+    last = outputs[-1]['simpleText']['text']
+    assert TRUNCATED_TEXT_NOTICE in last
+    assert MENU_URL in last
+
+
+def test_item_card_outputs_splits_more_than_ten_items_without_repeating():
+    card = notice_card(ITEM_LIST_MAX + 2)
+    outputs = item_card_outputs(card)
+    assert len(outputs) == 1
+
+    cards = outputs[0]['carousel']['items']
+    assert [len(c['itemList']) for c in cards] == [ITEM_LIST_MAX, 2]
+    assert [item for c in cards for item in c['itemList']] == card['itemList']
+
+
+def test_item_card_outputs_pairs_long_title_with_items_once():
+    card = menu_card(worst_case_menu_title())
+    card['itemList'] = [{"title": "항목", "description": str(n)} for n in range(12)]
+    outputs = item_card_outputs(card)
+
+    cards = outputs[0]['carousel']['items']
+    assert len(cards) == 2
+    assert 'title' in cards[0] and 'title' not in cards[1]
+    assert [item for c in cards for item in c['itemList']] == card['itemList']
+
+    titles = output_texts(outputs)
+    assert len(titles) == len(set(titles))
+
+
+def test_item_card_outputs_marks_dropped_cards():
+    card = notice_card(ITEM_LIST_MAX * (CAROUSEL_MAX + 2))
+    cards = item_card_outputs(card)[0]['carousel']['items']
+    assert len(cards) == CAROUSEL_MAX
+    assert TRUNCATED_NOTICE in cards[-1]['title']
+    assert cards[-1]['buttons'] == card['buttons']
+
+
+def test_lambda_response_serializes_once_with_headers():
+    response = lambda_response({"version": "2.0"}, headers={'Content-Type': 'application/json; charset=utf-8'})
+    assert response['statusCode'] == 200
+    assert json.loads(response['body']) == {"version": "2.0"}
+    assert response['headers']['Access-Control-Allow-Origin'] == '*'
+    assert response['headers']['Content-Type'] == 'application/json; charset=utf-8'
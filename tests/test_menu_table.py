@@ -0,0 +1,158 @@
+import importlib.util
+import json
+import os
+from datetime import date
+
+import pytest
+
+import storage
+from menu_table import dump_menu_grid, extract_menu_grid, get_meal, load_menu_grid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_DIR = os.path.join(ROOT, 'bench_pages')
+
+
+def read_page(name):
+    with open(os.path.join(PAGES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def load_handler(file_name):
+    # 핸들러 파일 이름이 한글이라 import 대신 경로로 불러옵니다.
+    spec = importlib.util.spec_from_file_location(file_name[:-3], os.path.join(ROOT, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def month_grid():
+    return extract_menu_grid(read_page('todayMenu1_month.html'), max_meals=3)
+
+
+@pytest.mark.parametrize('name, options, days', [
+    ('todayMenu1_week.html', {'max_meals': 3}, 7),
+    ('todayMenu2_week.html', {'date_class': 'text_center'}, 7),
+    ('todayMenu2_2weeks.html', {'date_class': 'text_center'}, 14),
+    ('todayMenu1_month.html', {'max_meals': 3}, 31),
+])
+def test_extract_menu_grid_from_pages(name, options, days):
+    grid = extract_menu_grid(read_page(name), **options)
+    assert grid.meal_names == ['조식', '중식', '석식']
+    assert len(grid.days) == days
+    assert len(grid.by_date) == days
+    # 원산지 행은 날짜로 잡히지 않습니다.
+    assert all("원산지" not in menu_day.label for menu_day in grid.days)
+    assert all(len(menu_day.meals) == 3 for menu_day in grid.days)
+
+
+def test_get_meal_matches_exact_date(month_grid):
+    assert month_grid.by_date[(3, 1)].label == "3/1 토"
+    assert month_grid.by_date[(3, 14)].label == "3/14 금"
+    # "3/1" 로 찾으면 "3/14" 가 아니라 3월 1일 칸이 나옵니다.
+    assert get_meal(month_grid, 3, 1, '중식') == month_grid.by_date[(3, 1)].meals[1]
+    assert get_meal(month_grid, 3, 1, '중식') != get_meal(month_grid, 3, 14, '중식')
+    assert "&amp;" not in get_meal(month_grid, 3, 14, '중식')
+
+
+def test_get_meal_missing_date_or_meal(month_grid):
+    assert get_meal(month_grid, 4, 1, '중식') is None
+    assert get_meal(month_grid, 3, 1, '야식') is None
+
+
+def test_dump_and_load_round_trip(month_grid):
+    grid = load_menu_grid(dump_menu_grid(month_grid))
+    assert grid.meal_names == month_grid.meal_names
+    assert grid.days == month_grid.days
+    assert grid.by_date == month_grid.by_date
+
+    # 같은 날짜가 두 번 나오는 표는 저장 전후 모두 첫 행을 씁니다.
+    html = (
+        '<table><tr><td>3/4<br>화</td><td>쌀밥</td></tr>'
+        '<tr><td>3/5<br>수</td><td>라면</td></tr>'
+        '<tr><td>3/4<br>화</td><td>김밥</td></tr></table>'
+    )
+    grid = extract_menu_grid(html, max_meals=1)
+    reloaded = load_menu_grid(dump_menu_grid(grid))
+    assert [menu_day.label for menu_day in grid.days] == ["3/4 화", "3/5 수"]
+    assert get_meal(grid, 3, 4, '조식') == get_meal(reloaded, 3, 4, '조식') == "쌀밥"
+    assert reloaded.days == grid.days
+
+
+@pytest.mark.parametrize('text', [
+    "3/1 토 조식\n쌀밥\n---",
+    '{"days": {}}',
+    '{"meal_names": ["조식"], "days": {"3-1": {"label": "3/1", "weekday": "", "meals": [""]}}}',
+    '[]',
+])
+def test_load_menu_grid_rejects_other_formats(text):
+    with pytest.raises(ValueError):
+        load_menu_grid(text)
+
+
+def test_cafeteria_handler_finds_exact_day(month_grid):
+    handler = load_handler('식당 메뉴 불러오기.py')
+    menus = handler.find_menus(month_grid, date(2025, 3, 14), '조식', True)
+    assert menus['중식'] == get_meal(month_grid, 3, 14, '중식') + "\n"
+
+    # 3월 1일(토) 빈 칸은 3/14 메뉴 대신 "중식 없음"으로 표시합니다.
+    assert get_meal(month_grid, 3, 1, '중식') == ''
+    assert handler.find_menus(month_grid, date(2025, 3, 1), '중식', False)['중식'] == "중식 없음\n"
+
+    assert handler.find_menus(month_grid, date(2025, 4, 1), '중식', False) == {"조식": "", "중식": "", "석식": ""}
+
+
+def test_student_hall_handler_finds_exact_day():
+    handler = load_handler('학생회관 메뉴 불러오기.py')
+    grid = extract_menu_grid(read_page('todayMenu2_2weeks.html'), date_class='text_center')
+    menus = handler.find_menus(grid, date(2025, 3, 14), '석식', False)
+    assert menus == {'석식': get_meal(grid, 3, 14, '석식')}
+    assert handler.find_menus(grid, date(2025, 3, 1), '석식', False) == {}
+    assert handler.find_menus(None, date(2025, 3, 14), '석식', True) == {}
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def local_storage(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, '_storages', {})
+    monkeypatch.setenv('STORAGE_BACKEND', 'local')
+    monkeypatch.setenv('STORAGE_DIR', str(tmp_path))
+    monkeypatch.delenv('MENU1_FILE_KEY', raising=False)
+    monkeypatch.delenv('MENU2_FILE_KEY', raising=False)
+    return tmp_path
+
+
+def test_menu_handlers_keep_separate_files_on_empty_store(local_storage, monkeypatch):
+    pages = {
+        'todayMenu1': read_page('todayMenu1_month.html'),
+        'todayMenu2': read_page('todayMenu2_week.html'),
+    }
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        name = url.rsplit('/', 1)[-1]
+        fetched.append(name)
+        return FakeResponse(pages[name])
+
+    cafeteria = load_handler('식당 메뉴 불러오기.py')
+    student_hall = load_handler('학생회관 메뉴 불러오기.py')
+    monkeypatch.setattr(cafeteria.requests, 'get', fake_get)
+
+    cafeteria.lambda_handler({'body': json.dumps({'action': {'params': {'time2': '오늘 메뉴'}}})}, None)
+    # 빈 저장소에서도 400 대신 todayMenu2 를 받아와 응답합니다.
+    response = student_hall.lambda_handler({'body': json.dumps({'action': {'params': {'time': '오늘 메뉴'}}})}, None)
+    assert response['statusCode'] == 200
+    assert 'todayMenu2' in fetched
+
+    backend = storage.get_storage()
+    menu1 = load_menu_grid(backend.read('todayMenu1.json'))
+    menu2 = load_menu_grid(backend.read('todayMenu2.json'))
+    assert len(menu1.days) == 31
+    assert len(menu2.days) == 7
@@ -0,0 +1,73 @@
+import json
+import pstats
+
+import pytest
+
+import storage
+import summarize_profiles
+from profiling import profiled, profiling_requested
+
+
+def skill_event(**params):
+    return {'body': json.dumps({"action": {"params": params}}, ensure_ascii=False)}
+
+
+@profiled
+def handler(event, context):
+    return sum(range(1000))
+
+
+@pytest.fixture(autouse=True)
+def profile_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, '_storages', {})
+    monkeypatch.setenv('STORAGE_BACKEND', 'sqlite')
+    monkeypatch.setenv('STORAGE_DB_PATH', str(tmp_path / 'storage.db'))
+    monkeypatch.setenv('PROFILE_DIR', str(tmp_path / 'profiles'))
+    monkeypatch.delenv('PROFILE_HANDLERS', raising=False)
+    monkeypatch.delenv('PROFILE_FILE_KEY', raising=False)
+
+
+def test_profiling_requested():
+    assert not profiling_requested(skill_event(time="오늘 메뉴"))
+    assert not profiling_requested(skill_event(debug="other"))
+    assert not profiling_requested({'body': '"debug" {not json'})
+    assert profiling_requested(skill_event(debug="profile"))
+
+
+def test_profiling_requested_by_env(monkeypatch):
+    monkeypatch.setenv('PROFILE_HANDLERS', '1')
+    assert profiling_requested(skill_event())
+
+
+def test_handler_without_debug_writes_nothing(tmp_path):
+    assert handler(skill_event(), None) == sum(range(1000))
+    assert not (tmp_path / 'profiles').exists()
+
+
+def test_profile_is_saved_locally_and_to_storage(monkeypatch, tmp_path):
+    monkeypatch.setenv('PROFILE_FILE_KEY', 'profiles')
+    assert handler(skill_event(debug="profile"), None) == sum(range(1000))
+
+    local = sorted(path.suffix for path in (tmp_path / 'profiles').iterdir())
+    assert local == ['.collapsed', '.prof']
+
+    keys = storage.get_storage().list_keys('profiles/')
+    assert sorted(key.rsplit('.', 1)[1] for key in keys) == ['collapsed', 'prof']
+
+
+def test_summarize_reads_profiles_from_storage(monkeypatch, tmp_path):
+    monkeypatch.setenv('PROFILE_FILE_KEY', 'profiles')
+    for _ in range(3):
+        handler(skill_event(debug="profile"), None)
+
+    files = summarize_profiles.download_profiles('profiles/', str(tmp_path))
+    assert len(files) == 3
+    assert any('handler' in func[2] for func in pstats.Stats(*files).stats)
+
+
+def test_collapsed_stacks_lines_are_weighted(monkeypatch, tmp_path):
+    handler(skill_event(debug="profile"), None)
+    collapsed = next((tmp_path / 'profiles').glob('*.collapsed')).read_text(encoding='utf-8')
+    for line in collapsed.strip().split('\n'):
+        stack, weight = line.rsplit(' ', 1)
+        assert stack and int(weight) > 0
@@ -0,0 +1,155 @@
+import io
+
+import pytest
+
+import storage
+from storage import CachedStorage, LocalStorage, S3Storage, SQLiteStorage, get_storage
+
+
+class FakeS3Client:
+    # boto3 S3 클라이언트 중 S3Storage 가 쓰는 부분만 흉내 냅니다.
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+    def __init__(self):
+        self.objects = {}
+        self.gets = 0
+
+    def get_object(self, Bucket, Key):
+        self.gets += 1
+        if (Bucket, Key) not in self.objects:
+            raise self.exceptions.NoSuchKey()
+        return {'Body': io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[(Bucket, Key)] = Body
+
+    def get_paginator(self, name):
+        objects = self.objects
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                keys = sorted(key for bucket, key in objects if bucket == Bucket and key.startswith(Prefix))
+                yield {'Contents': [{'Key': key} for key in keys]} if keys else {}
+
+        return Paginator()
+
+
+def make_s3(bucket='bucket'):
+    s3 = S3Storage(bucket)
+    s3._client = FakeS3Client()
+    return s3
+
+
+@pytest.fixture(params=['s3', 'local', 'sqlite'])
+def backend(request, tmp_path):
+    if request.param == 's3':
+        return make_s3()
+    if request.param == 'local':
+        return LocalStorage('bucket', str(tmp_path))
+    return SQLiteStorage('bucket', str(tmp_path / 'storage.db'))
+
+
+def test_round_trip(backend):
+    backend.write('menu.txt', '3/4 월 조식\n쌀밥')
+    assert backend.read('menu.txt') == '3/4 월 조식\n쌀밥'
+    assert backend.refresh('menu.txt') == '3/4 월 조식\n쌀밥'
+
+
+def test_overwrite(backend):
+    backend.write('menu.txt', 'old')
+    backend.write('menu.txt', 'new')
+    assert backend.read('menu.txt') == 'new'
+
+
+def test_missing_key_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        backend.read('missing.txt')
+
+
+def test_bytes_round_trip(backend):
+    body = bytes(range(256))
+    backend.write_bytes('profiles/run.prof', body)
+    assert backend.read_bytes('profiles/run.prof') == body
+
+
+def test_list_keys_by_prefix(backend):
+    backend.write('menu.txt', 'menu')
+    backend.write('profiles/a.collapsed', 'a 1')
+    backend.write_bytes('profiles/a.prof', b'a')
+    assert backend.list_keys('profiles/') == ['profiles/a.collapsed', 'profiles/a.prof']
+    assert backend.list_keys('missing/') == []
+
+
+def test_sqlite_buckets_do_not_collide(tmp_path):
+    db_path = str(tmp_path / 'storage.db')
+    SQLiteStorage('a', db_path).write('menu.txt', 'a')
+    SQLiteStorage('b', db_path).write('menu.txt', 'b')
+    assert SQLiteStorage('a', db_path).read('menu.txt') == 'a'
+
+
+def test_cached_reads_locally_within_ttl(tmp_path):
+    remote = make_s3()
+    cached = CachedStorage(SQLiteStorage('bucket', str(tmp_path / 'cache.db')), remote, ttl=600)
+    remote.write('menu.txt', 'week 1')
+
+    assert cached.read('menu.txt') == 'week 1'
+    gets = remote.client.gets
+    assert cached.read('menu.txt') == 'week 1'
+    assert remote.client.gets == gets
+
+
+def test_cached_picks_up_other_containers_upload(tmp_path):
+    remote = make_s3()
+    cached = CachedStorage(SQLiteStorage('bucket', str(tmp_path / 'cache.db')), remote, ttl=600)
+    cached.write('menu.txt', 'week 1')
+
+    # 다른 컨테이너가 S3에 새 메뉴를 올린 경우
+    remote.write('menu.txt', 'week 2')
+    assert cached.read('menu.txt') == 'week 1'
+    assert cached.refresh('menu.txt') == 'week 2'
+    assert cached.read('menu.txt') == 'week 2'
+
+
+def test_cached_revalidates_after_ttl(tmp_path):
+    remote = make_s3()
+    cached = CachedStorage(SQLiteStorage('bucket', str(tmp_path / 'cache.db')), remote, ttl=0)
+    cached.write('menu.txt', 'week 1')
+    remote.write('menu.txt', 'week 2')
+    assert cached.read('menu.txt') == 'week 2'
+
+
+def test_cached_falls_back_to_local_copy_when_remote_fails(tmp_path):
+    remote = make_s3()
+    cached = CachedStorage(SQLiteStorage('bucket', str(tmp_path / 'cache.db')), remote, ttl=0)
+    cached.write('menu.txt', 'week 1')
+
+    def broken_get_object(Bucket, Key):
+        raise ConnectionError('network down')
+
+    remote.client.get_object = broken_get_object
+    assert cached.read('menu.txt') == 'week 1'
+
+
+def test_cached_write_goes_to_both(tmp_path):
+    remote = make_s3()
+    local = SQLiteStorage('bucket', str(tmp_path / 'cache.db'))
+    CachedStorage(local, remote).write('menu.txt', 'body')
+    assert remote.read('menu.txt') == 'body'
+    assert local.read('menu.txt') == 'body'
+
+
+def test_get_storage_selects_backend(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, '_storages', {})
+    monkeypatch.setenv('STORAGE_DIR', str(tmp_path))
+    monkeypatch.setenv('STORAGE_DB_PATH', str(tmp_path / 'storage.db'))
+
+    for name, cls in [('s3', S3Storage), ('local', LocalStorage), ('sqlite', SQLiteStorage), ('cached', CachedStorage)]:
+        monkeypatch.setenv('STORAGE_BACKEND', name)
+        assert isinstance(get_storage('bucket'), cls)
+        assert get_storage('bucket') is get_storage('bucket')
+
+    monkeypatch.setenv('STORAGE_BACKEND', 'ftp')
+    with pytest.raises(ValueError):
+        get_storage('bucket')
@@ -1,92 +1,39 @@
-import boto3
+import os
 import json
 from datetime import datetime, timedelta
 import requests
-from bs4 import BeautifulSoup
+from storage import get_storage
+from menu_table import extract_menu_grid, dump_menu_grid, load_menu_grid, get_meal
+from kakao_response import item_card_outputs, lambda_response
+from profiling import profiled
 
-def read_s3_file(bucket_name, file_key):
-    s3 = boto3.client('s3')
-    try:
-        obj = s3.get_object(Bucket=bucket_name, Key=file_key)
-        return obj['Body'].read().decode('utf-8')
-    except s3.exceptions.NoSuchKey:
-        raise ValueError(f"The file {file_key} does not exist in the bucket {bucket_name}.")
-
-def split_text(text, max_length=1000):
-    lines = text.split('\n')
-    chunks = []
-    current_chunk = ""
+def scrape_menu_and_save(storage, file_key):
+    url = 'https://www.mmu.ac.kr/main/contents/todayMenu1'
+    response = requests.get(url)
 
-    for line in lines:
-        if len(current_chunk) + len(line) + 1 > max_length:
-            chunks.append(current_chunk)
-            current_chunk = line + "\n"
-        else:
-            current_chunk += line + "\n"
+    # 날짜 x (조식, 중식, 석식) 격자로 추출해 그대로 저장
+    grid = extract_menu_grid(response.text, max_meals=3)
+    storage.write(file_key, dump_menu_grid(grid))
 
-    if current_chunk:
-        chunks.append(current_chunk)
 
-    return chunks
+def find_menus(grid, target_date, meal_type, show_all_today):
+    # 격자에서 해당 날짜의 식사별 메뉴를 찾습니다. (빈 칸은 "조식 없음"처럼 표시)
+    menus = {"조식": "", "중식": "", "석식": ""}
 
-def scrape_menu_and_save_to_s3(bucket_name, file_key):
-    url = 'https://www.mmu.ac.kr/main/contents/todayMenu1'
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    menu_data = []
-    current_date = ''
-    
-    for row in soup.find_all('tr')[1:]:
-        columns = row.find_all('td')
-        
-        if len(columns) > 0:
-            date_column = columns[0].get_text(strip=True).replace('\n', ' ')
-            meal_columns = [col.get_text(separator='\n', strip=True).replace('&amp;', '&') for col in columns[1:4]]
-            
-            if "원산지" in date_column:
-                continue
-            
-            if date_column:
-                if len(date_column) > 0:
-                    date_column = date_column.replace('월', ' 월').replace('화', ' 화').replace('수', ' 수').replace('목', ' 목').replace('금', ' 금')
-                
-                current_date = date_column
-                menu_data.append(f'{current_date} 조식')
-                
-                if len(meal_columns) > 0 and meal_columns[0]:
-                    menu_data.append(meal_columns[0])
-                else:
-                    menu_data.append('조식 없음')
-                
-                menu_data.append('---')
-                menu_data.append(f'{current_date} 중식')
-                
-                if len(meal_columns) > 1 and meal_columns[1]:
-                    menu_data.append(meal_columns[1])
-                else:
-                    menu_data.append('중식 없음')
-                    
-                menu_data.append('---')
-                menu_data.append(f'{current_date} 석식')
-                
-                if len(meal_columns) > 2 and meal_columns[2]:
-                    menu_data.append(meal_columns[2])
-                else:
-                    menu_data.append('석식 없음')
-                    
-                menu_data.append('---')
-    
-    formatted_data = '\n'.join([line for line in menu_data if line != '---\n---'])
-    
-    s3 = boto3.client('s3')
-    s3.put_object(Bucket=bucket_name, Key=file_key, Body=formatted_data.encode('utf-8'))
+    for meal in menus.keys():
+        if not show_all_today and meal != meal_type:
+            continue
+        menu = get_meal(grid, target_date.month, target_date.day, meal)
+        if menu is not None:
+            menus[meal] = (menu or f"{meal} 없음") + "\n"
 
+    return menus
 
 def get_korean_day_of_week(weekday):
     days = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
     return days[weekday]
 
+@profiled
 def lambda_handler(event, context):
     request_body = json.loads(event['body'])
     params = request_body['action']['params']
@@ -107,60 +54,30 @@ def lambda_handler(event, context):
         show_all_today = False
         menu_day_label = "학생회관 식당 메뉴"
 
-    bucket_name = 'Private'
-    file_key = 'Private'
+    storage = get_storage()
+    file_key = os.environ.get('MENU1_FILE_KEY', 'todayMenu1.json')
 
     try:
-        file_content = read_s3_file(bucket_name, file_key)
+        grid = load_menu_grid(storage.read(file_key))
     except ValueError:
-        scrape_menu_and_save_to_s3(bucket_name, file_key)
-        file_content = read_s3_file(bucket_name, file_key)
+        scrape_menu_and_save(storage, file_key)
+        grid = load_menu_grid(storage.read(file_key))
 
-    lines = file_content.split('\n')
-    
     current_date = datetime.now() + timedelta(hours=9)
     target_date = current_date + timedelta(days=date_offset)
     date_info = target_date.strftime('%m월 %d일') + " " + get_korean_day_of_week(target_date.weekday())
-    simple_date_info = target_date.strftime('%-m/%-d')
 
-    menus = {"조식": "", "중식": "", "석식": ""}
-    response_text = ""  # response_text 변수를 초기화
-    menu_found = False
-    current_meal_type = ""
+    menus = find_menus(grid, target_date, meal_type, show_all_today)
 
-    if show_all_today:
-        for line in lines:
-            if simple_date_info in line:
-                for meal in menus.keys():
-                    if meal in line:
-                        current_meal_type = meal
-                        menu_found = True
-                        break
-            elif menu_found and line.strip() == "---":
-                current_meal_type = ""
-            elif menu_found and current_meal_type:
-                if simple_date_info in line or current_meal_type in line:
-                    continue
-                menus[current_meal_type] += line.strip() + "\n"
-        
-        for meal, menu in menus.items():
-            if menu:
-                response_text += f"{date_info} {meal}\n{menu}\n"
-    else:
-        for line in lines:
-            if simple_date_info in line and meal_type in line:
-                menu_found = True
-                response_text += f"{date_info} {meal_type}\n"
-                continue
-            if line.strip() == "---" and menu_found:
-                break
-            if menu_found:
-                if simple_date_info in line or meal_type in line:
-                    continue
-                response_text += line.strip() + "\n"
+    if not any(menus.values()):
+        # 다른 컨테이너가 이미 새 메뉴를 올려 두었을 수 있으므로 저장소 원본을 먼저 확인합니다.
+        try:
+            menus = find_menus(load_menu_grid(storage.refresh(file_key)), target_date, meal_type, show_all_today)
+        except ValueError:
+            pass
 
     if not any(menus.values()):
-        scrape_menu_and_save_to_s3(bucket_name, file_key)
+        scrape_menu_and_save(storage, file_key)
         response_text = "해당하는 메뉴 정보를 찾을 수 없습니다.\n메뉴 자동 갱신 중입니다.\n3초 뒤 다시 시도해 주세요.\n방학 기간엔 교내 사이트에 메뉴 정보가 업로드 되지 않으므로 기다려도 메뉴 정보를 불러올 수 없어요."
 
     now = datetime.now() + timedelta(hours=9)
@@ -203,42 +120,41 @@ def lambda_handler(event, context):
     # 주말 여부에 따른 점심 시간 설명
     lunch_time_description = "12:00 ~ 13:00" if is_weekend else "11:30 ~ 13:30"
 
-    result = {
-    "version": "2.0",
-    "template": {
-        "outputs": [
+    item_card = {
+        "imageTitle": {
+            "title": date_info,
+            "description": menu_day_label
+        },
+        "title": menu_titles,
+        "itemList": [
+            {
+                "title": f"조식 {breakfast_icon}",
+                "description": "08:00 ~ 09:00"
+            },
+            {
+                "title": f"중식 {lunch_icon}",
+                "description": lunch_time_description
+            },
+            {
+                "title": f"석식 {dinner_icon}",
+                "description": "17:30 ~ 18:30"
+            }
+        ],
+        "buttons": [
             {
-                "itemCard": {
-                    "imageTitle": {
-                        "title": date_info,
-                        "description": menu_day_label
-                    },
-                    "title": menu_titles,
-                    "itemList": [
-                        {
-                            "title": f"조식 {breakfast_icon}",
-                            "description": "08:00 ~ 09:00"
-                        },
-                        {
-                            "title": f"중식 {lunch_icon}",
-                            "description": lunch_time_description
-                        },
-                        {
-                            "title": f"석식 {dinner_icon}",
-                            "description": "17:30 ~ 18:30"
-                        }
-                    ],
-                    "buttons": [
-                        {
-                            "action": "webLink",
-                            "label": "전체 메뉴 보러가기",
-                            "webLinkUrl": "https://www.mmu.ac.kr/main/contents/todayMenu1"
-                        }
-                    ],
-                    "itemListAlignment": "right"
-                }
+                "action": "webLink",
+                "label": "전체 메뉴 보러가기",
+                "webLinkUrl": "https://www.mmu.ac.kr/main/contents/todayMenu1"
             }
         ],
+        "itemListAlignment": "right"
+    }
+
+    result = {
+    "version": "2.0",
+    "template": {
+        # 메뉴가 길면 카드 여러 장으로 나눠 보냅니다.
+        "outputs": item_card_outputs(item_card),
         "quickReplies": [
             {
                 "messageText": "해성게시판",
@@ -260,10 +176,4 @@ def lambda_handler(event, context):
 }
 
 
-    return {
-        'statusCode': 200,
-        'body': json.dumps(result, ensure_ascii=False),
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-        }
-    }
+    return lambda_response(result)
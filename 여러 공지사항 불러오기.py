@@ -1,17 +1,17 @@
 import requests
 from bs4 import BeautifulSoup
 import json
+from kakao_response import item_card_outputs, lambda_response
+from profiling import profiled
 
+@profiled
 def lambda_handler(event, context):
     try:
         # body를 파싱하여 board_type 추출
         body = json.loads(event['body'])
         board_type = body.get('action', {}).get('params', {}).get('board_type', "")
     except (json.JSONDecodeError, KeyError):
-        return {
-            'statusCode': 400,
-            'body': json.dumps({"error": "Invalid request format"}, ensure_ascii=False)
-        }
+        return lambda_response({"error": "Invalid request format"}, status_code=400)
 
     # URL 및 게시판 이름 선택
     if board_type == "해성공지":
@@ -27,20 +27,14 @@ def lambda_handler(event, context):
         url = "https://www.mmu.ac.kr/main/board/262"
         board_name = "인검전달사항"
     else:
-        return {
-            'statusCode': 400,
-            'body': json.dumps({"error": "Invalid board_type"}, ensure_ascii=False)
-        }
+        return lambda_response({"error": "Invalid board_type"}, status_code=400)
 
     # 웹 페이지 요청
     try:
         response = requests.get(url)
         response.encoding = 'utf-8'
     except requests.exceptions.RequestException as e:
-        return {
-            'statusCode': 500,
-            'body': json.dumps({"error": "Failed to retrieve page"}, ensure_ascii=False)
-        }
+        return lambda_response({"error": "Failed to retrieve page"}, status_code=500)
 
     # 페이지 파싱
     soup = BeautifulSoup(response.text, 'html.parser')
@@ -81,30 +75,29 @@ def lambda_handler(event, context):
     # 일반 게시물 리스트 생성
     general_item_list = [{"title": "일반공지", "description": post} for post in general_posts]
 
+    item_card = {
+        "imageTitle": {
+            "title": board_name,
+            "description": "일반공지는 최근 4~7개 내역만 불러옵니다."
+        },
+        "itemList": notice_item_list + general_item_list,  # 공지사항과 일반 공지 모두 포함
+        "itemListAlignment": "right",
+        "buttons": [
+            {
+                "label": f"{board_name} 바로가기",
+                "action": "webLink",
+                "webLinkUrl": url
+            }
+        ],
+        "buttonLayout": "vertical"
+    }
+
     # JSON 응답 구성
     result = {
         "version": "2.0",
         "template": {
-            "outputs": [
-                {
-                    "itemCard": {
-                        "imageTitle": {
-                            "title": board_name,
-                            "description": "일반공지는 최근 4~7개 내역만 불러옵니다."
-                        },
-                        "itemList": notice_item_list + general_item_list,  # 공지사항과 일반 공지 모두 포함
-                        "itemListAlignment": "right",
-                        "buttons": [
-                            {
-                                "label": f"{board_name} 바로가기",
-                                "action": "webLink",
-                                "webLinkUrl": url
-                            }
-                        ],
-                        "buttonLayout": "vertical"
-                    }
-                }
-            ],
+            # 항목이 많으면 카드 여러 장으로 나눠 보냅니다.
+            "outputs": item_card_outputs(item_card),
             "quickReplies": [
                 {
                     "messageText": "인검전달사항",
@@ -130,10 +123,4 @@ def lambda_handler(event, context):
         }
     }
 
-    return {
-        'statusCode': 200,
-        'body': json.dumps(result, ensure_ascii=False),
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-        }
-    }
+    return lambda_response(result)
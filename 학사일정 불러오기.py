@@ -1,55 +1,45 @@
+import re
 import json
 import requests
-from datetime import datetime
+from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta  # relativedelta를 추가합니다.
+from calendar_store import get_calendar
+from kakao_response import text_outputs, lambda_response
+from profiling import profiled
 
-def get_schedule(month_offset):
-    # 요청할 URL
-    url = 'https://www.mmu.ac.kr/main/scheduleList'
-
-    # 현재 날짜를 기준으로 월을 가져오기
-    current_date = datetime.now() + relativedelta(months=month_offset)  # 월 단위로 더함
-    current_month = current_date.strftime("%Y-%m")  # "2024-11" 형식 (예: 다음달)
-
-    # 요청 데이터 설정
-    params = {
-        "libType": "D",  # 기본값으로 설정
-        "searchDt": current_month,  # 예: "2024-11"
-        "hakgi": "0",  # 기본값으로 설정
-        "recordCnt": 999,
-        "year": current_date.year  # 요청할 연도
-    }
+def get_today():
+    # 한국 시간 기준 오늘 날짜
+    return (datetime.now() + timedelta(hours=9)).date()
 
+def load_calendar(*years, optional_years=()):
     try:
-        # GET 요청
-        response = requests.get(url, params=params)
-        response.raise_for_status()  # 오류가 있을 경우 예외 발생
+        return get_calendar(*years, optional_years=optional_years), None
     except requests.exceptions.RequestException as e:
         # 요청 실패 시 에러 메시지 반환
-        return f"일정 데이터를 가져오는 중 오류가 발생했습니다: {e}"
+        return None, f"일정 데이터를 가져오는 중 오류가 발생했습니다: {e}"
+    except ValueError:
+        return None, "일정 데이터를 파싱하는 중 오류가 발생했습니다."
 
-    try:
-        # JSON 데이터 로드
-        schedule_data = response.json()
-    except json.JSONDecodeError:
-        return "일정 데이터를 파싱하는 중 오류가 발생했습니다."
+def format_event(event):
+    # 여러 날짜에 걸친 일정은 기간으로 표시
+    if event.start == event.end:
+        return f"{event.start:%Y-%m-%d} : {event.title}"
+    return f"{event.start:%Y-%m-%d} ~ {event.end:%Y-%m-%d} : {event.title}"
+
+def get_schedule(month_offset):
+    # 현재 날짜를 기준으로 월을 가져오기
+    current_date = get_today() + relativedelta(months=month_offset)  # 월 단위로 더함
+    first_day = current_date.replace(day=1)
+    last_day = first_day + relativedelta(months=1) - timedelta(days=1)
+
+    calendar, error = load_calendar(current_date.year)
+    if error:
+        return error
 
-    # 결과 출력 형식 준비
+    # 시작일 기준으로 날짜별로 묶기
     result = {}
-    if 'list' in schedule_data and schedule_data['list']:
-        for item in schedule_data['list']:
-            # 현재 날짜와 비교하여 월이 같은지 확인
-            try:
-                item_date = datetime.strptime(item['frdt'], "%Y-%m-%d")
-            except (KeyError, ValueError):
-                continue  # 날짜 형식이 맞지 않거나 키가 없을 경우 건너뜀
-
-            if item_date.month == current_date.month and item_date.year == current_date.year:
-                # 날짜가 이미 키로 존재하는지 확인
-                if item['frdt'] in result:
-                    result[item['frdt']].append(item['title'])  # 제목 추가
-                else:
-                    result[item['frdt']] = [item['title']]  # 새로운 날짜 키 추가
+    for event in calendar.starting_between(first_day, last_day):
+        result.setdefault(f"{event.start:%Y-%m-%d}", []).append(event.title)
 
     # 최종 출력 형식 준비
     formatted_result = []
@@ -63,62 +53,96 @@ def get_schedule(month_offset):
     # 최종 결과를 문자열으로 반환
     return "\n".join(formatted_result)
 
+def get_schedule_between(first_day, last_day):
+    # 기간과 겹치는 일정 (며칠에 걸친 일정도 포함)
+    # 작년에 시작해 올해까지 이어지는 일정도 찾도록 한 해 전부터 불러옵니다.
+    calendar, error = load_calendar(*range(first_day.year, last_day.year + 1), optional_years=[first_day.year - 1])
+    if error:
+        return error
+
+    events = calendar.overlapping(first_day, last_day)
+    if not events:
+        return "등록된 일정이 없습니다."
+    return "\n".join(format_event(event) for event in events)
+
+def get_dday(keyword):
+    # 작년부터 내년까지 일정 중 keyword가 들어간 가장 가까운 일정까지 남은 날짜
+    today = get_today()
+    calendar, error = load_calendar(today.year, optional_years=[today.year - 1, today.year + 1])
+    if error:
+        return error
+
+    event = calendar.next_event(keyword, today)
+    if event is None:
+        return f"예정된 '{keyword}' 일정이 없습니다."
+
+    days_left = (event.start - today).days
+    if days_left > 0:
+        return f"D-{days_left}\n{format_event(event)}"
+    return f"진행 중입니다.\n{format_event(event)}"
+
+@profiled
 def lambda_handler(event, context):
     try:
         # 이벤트에서 cal_type 파라미터 추출
         body = json.loads(event['body'])
         cal_type = body['action']['params'].get('cal_type', '')
 
-        # 월 오프셋 결정
-        month_offset = 0  # 이번달
-        if "다음달" in cal_type:
-            month_offset = 1
-        elif "저번달" in cal_type:
-            month_offset = -1
-
-        # 일정 가져오기
-        schedule = get_schedule(month_offset)
-
-        # 월과 년도 추출
-        current_date = datetime.now() + relativedelta(months=month_offset)
-        current_year = current_date.year
-        current_month = current_date.month
-
-        # 제목과 설명을 월에 따라 가변적으로 설정
-        title = f"{current_year}년 {current_month}월 학사일정"
-        description = f"{current_month}월의 학사일정을 불러옵니다."
+        today = get_today()
+        days_match = re.search(r'(\d+)\s*일', cal_type)
+
+        if re.search(r'디데이|d-day', cal_type, re.IGNORECASE):
+            # 예: "기말고사 디데이"
+            keyword = re.sub(r'디데이|d-day|까지', '', cal_type, flags=re.IGNORECASE).strip()
+            title = f"{keyword or '학사일정'} 디데이"
+            description = f"{keyword or '일정'}까지 남은 날짜를 불러옵니다."
+            schedule = get_dday(keyword) if keyword else "디데이를 확인할 일정 이름을 함께 입력해 주세요."
+        elif "이번주" in cal_type:
+            first_day = today - timedelta(days=today.weekday())
+            last_day = first_day + timedelta(days=6)
+            title = "이번주 학사일정"
+            description = f"{first_day:%m-%d} ~ {last_day:%m-%d} 학사일정을 불러옵니다."
+            schedule = get_schedule_between(first_day, last_day)
+        elif days_match:
+            # 예: "14일 학사일정" -> 오늘부터 14일 동안
+            days = min(max(int(days_match.group(1)), 1), 366)
+            last_day = today + timedelta(days=days - 1)
+            title = f"앞으로 {days}일 학사일정"
+            description = f"{today:%m-%d} ~ {last_day:%m-%d} 학사일정을 불러옵니다."
+            schedule = get_schedule_between(today, last_day)
+        else:
+            # 월 오프셋 결정
+            month_offset = 0  # 이번달
+            if "다음달" in cal_type:
+                month_offset = 1
+            elif "저번달" in cal_type:
+                month_offset = -1
+
+            # 일정 가져오기
+            schedule = get_schedule(month_offset)
+
+            # 월과 년도 추출
+            current_date = today + relativedelta(months=month_offset)
+            current_year = current_date.year
+            current_month = current_date.month
+
+            # 제목과 설명을 월에 따라 가변적으로 설정
+            title = f"{current_year}년 {current_month}월 학사일정"
+            description = f"{current_month}월의 학사일정을 불러옵니다."
 
         # result 출력 형식으로 변경 (simpleText 예시)
         result = {
             "version": "2.0",
             "template": {
-                "outputs": [
-                    {
-                        "simpleText": {
-                            "text": f"{title}\n{description}\n\n{schedule}"
-                        }
-                    }
-                ]
+                # 일정이 길면 simpleText 여러 개로 나눠 보냅니다.
+                "outputs": text_outputs(f"{title}\n{description}\n\n{schedule}")
             }
         }
 
         # JSON 응답 반환
-        return {
-            'statusCode': 200,
-            'body': json.dumps(result, ensure_ascii=False),
-            'headers': {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Access-Control-Allow-Origin': '*',
-            }
-        }
+        return lambda_response(result, headers={'Content-Type': 'application/json; charset=utf-8'})
 
     except Exception as e:
         # 에러 발생 시 적절한 응답 반환
-        return {
-            'statusCode': 500,
-            'body': json.dumps({"message": f"서버 오류가 발생했습니다: {e}"}),
-            'headers': {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Access-Control-Allow-Origin': '*',
-            }
-        }
+        return lambda_response({"message": f"서버 오류가 발생했습니다: {e}"}, status_code=500,
+                               headers={'Content-Type': 'application/json; charset=utf-8'})
@@ -1,19 +1,13 @@
 import os
-import boto3
 import json
 from datetime import datetime, timedelta
 import requests
-from bs4 import BeautifulSoup as bs
+from storage import get_storage
+from menu_table import extract_menu_grid, dump_menu_grid, load_menu_grid, get_meal
+from kakao_response import item_card_outputs, lambda_response
+from profiling import profiled
 
-def read_s3_file(bucket_name, file_key):
-    s3 = boto3.client('s3')
-    try:
-        obj = s3.get_object(Bucket=bucket_name, Key=file_key)
-        return obj['Body'].read().decode('utf-8')
-    except s3.exceptions.NoSuchKey:
-        raise ValueError(f"The file {file_key} does not exist in the bucket {bucket_name}.")
-
-def scrape_and_upload_to_s3(bucket_name, file_key):
+def scrape_and_upload(storage, file_key):
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/106.0.0.0 Safari/537.36"
     }
@@ -21,33 +15,35 @@ def scrape_and_upload_to_s3(bucket_name, file_key):
     res = requests.get(url, headers=headers)
     res.raise_for_status()
 
-    soup = bs(res.text, 'html.parser')
-    rows = soup.find_all('tr')
-
-    food_data = ""
+    # 날짜 x 식사 격자로 추출해 그대로 저장
+    grid = extract_menu_grid(res.text, date_class='text_center')
 
-    for row in rows:
-        date_day_td = row.find('td', class_='text_center')
-        if date_day_td:
-            date_day = date_day_td.get_text(separator=' ', strip=True).split(' ')[0]
-            menu_tds = row.find_all('td')[1:]
-            meal_times = ['조식', '중식', '석식']
-            for index, menu_td in enumerate(menu_tds):
-                menu = menu_td.get_text(separator='\n', strip=True)
-                meal_time = meal_times[index] if index < len(meal_times) else f"식사 {index+1}"
-                food_data += f"{date_day} {meal_time}\n{menu}\n---\n"
-
-    s3 = boto3.client('s3')
     try:
-        s3.put_object(Bucket=bucket_name, Key=file_key, Body=food_data, ContentType='text/plain; charset=utf-8')
+        storage.write(file_key, dump_menu_grid(grid))
         print("File uploaded successfully.")
     except Exception as e:
         print(f"Error uploading file: {str(e)}")
 
+def find_menus(grid, target_date, meal_type, show_all_today):
+    # 격자에서 해당 날짜의 식사별 메뉴를 찾습니다. (메뉴가 없는 식사는 빠집니다.)
+    menus = {}
+    if grid is None:
+        return menus
+
+    for meal in ["조식", "중식", "석식"]:
+        if not show_all_today and meal != meal_type:
+            continue
+        menu = get_meal(grid, target_date.month, target_date.day, meal)
+        if menu:
+            menus[meal] = menu
+
+    return menus
+
 def get_korean_day_of_week(weekday):
     days = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
     return days[weekday]
 
+@profiled
 def lambda_handler(event, context):
     # Log the event to CloudWatch
     print("Received event:", json.dumps(event, ensure_ascii=False))
@@ -71,65 +67,42 @@ def lambda_handler(event, context):
         show_all_today = False
         menu_day_label = "해사대학 학식 메뉴"
 
-    bucket_name = 'Private'
-    file_key = 'Private'
+    storage = get_storage()
+    file_key = os.environ.get('MENU2_FILE_KEY', 'todayMenu2.json')
 
     try:
-        file_content = read_s3_file(bucket_name, file_key)
-    except ValueError as e:
-        return {
-            'statusCode': 400,
-            'body': json.dumps({'error': str(e)}),
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-            }
-        }
+        file_content = storage.read(file_key)
+    except ValueError:
+        # 저장된 파일이 없으면(처음 실행 등) 받아와서 다시 읽습니다.
+        scrape_and_upload(storage, file_key)
+        try:
+            file_content = storage.read(file_key)
+        except ValueError as e:
+            return lambda_response({'error': str(e)}, status_code=400)
+
+    try:
+        grid = load_menu_grid(file_content)
+    except ValueError:
+        # 예전 형식으로 저장된 파일이면 아래에서 다시 받아옵니다.
+        grid = None
 
-    lines = file_content.split('\n')
     current_date = datetime.now() + timedelta(hours=9)
     target_date = current_date + timedelta(days=date_offset)
     
     # 날짜를 'MM월 DD일 요일' 형식으로 변환
     date_info = target_date.strftime(f'%m월 %d일 {get_korean_day_of_week(target_date.weekday())}')
-    simple_date_info = target_date.strftime('%-m/%-d')
-
-    menus = {"조식": "", "중식": "", "석식": ""}
-    menu_found = False
-    current_meal_type = ""
-
-    if show_all_today:
-        for line in lines:
-            if simple_date_info in line:
-                for meal in menus.keys():
-                    if meal in line:
-                        current_meal_type = meal
-                        menu_found = True
-                        break
-            elif menu_found and line.strip() == "---":
-                current_meal_type = ""
-            elif menu_found and current_meal_type:
-                if simple_date_info in line or current_meal_type in line:
-                    continue
-                menus[current_meal_type] += line.strip() + "\n"
-
-        menus = {meal: menu.strip() for meal, menu in menus.items() if menu.strip()}
 
-    else:
-        response_text = ""
-        for line in lines:
-            if simple_date_info in line and meal_type in line:
-                menu_found = True
-                response_text = f"{date_info} {meal_type}\n"
-                continue
-            if line.strip() == "---" and menu_found:
-                break
-            if menu_found:
-                if simple_date_info in line or meal_type in line:
-                    continue
-                response_text += line.strip() + "\n"
+    menus = find_menus(grid, target_date, meal_type, show_all_today)
+
+    if not any(menus.values()):
+        # 다른 컨테이너가 이미 새 메뉴를 올려 두었을 수 있으므로 저장소 원본을 먼저 확인합니다.
+        try:
+            menus = find_menus(load_menu_grid(storage.refresh(file_key)), target_date, meal_type, show_all_today)
+        except ValueError:
+            pass
 
     if not any(menus.values()):
-        scrape_and_upload_to_s3(bucket_name, file_key)
+        scrape_and_upload(storage, file_key)
         response_text = "해당하는 메뉴 정보를 찾을 수 없습니다.\n메뉴 자동 갱신 중입니다.\n3초 뒤 다시 시도해 주세요.\n방학 기간엔 교내 사이트에 메뉴 정보가 업로드 되지 않으므로 기다려도 메뉴 정보를 불러올 수 없어요."
 
     # 현재 시간을 가져오기
@@ -169,42 +142,41 @@ def lambda_handler(event, context):
     # 중식 시간 조정
     lunch_time_description = "11:40 ~ 13:00" if is_weekend else "11:40 ~ 13:30"
 
+    item_card = {
+        "imageTitle": {
+            "title": date_info,
+            "description": menu_day_label
+        },
+        "title": menu_titles,
+        "itemList": [
+            {
+                "title": f"조식 {breakfast_icon}",
+                "description": "07:20 ~ 08:30"
+            },
+            {
+                "title": f"중식 {lunch_icon}",
+                "description": lunch_time_description
+            },
+            {
+                "title": f"석식 {dinner_icon}",
+                "description": "17:20 ~ 18:30"
+            }
+        ],
+        "itemListAlignment": "right",
+        "buttons": [
+            {
+              "action": "webLink",
+              "label": "전체 메뉴 보러가기",
+              "webLinkUrl": "https://www.mmu.ac.kr/main/contents/todayMenu2"
+            }
+        ]
+    }
+
     result = {
         "version": "2.0",
         "template": {
-            "outputs": [
-                {
-                    "itemCard": {
-                        "imageTitle": {
-                            "title": date_info,
-                            "description": menu_day_label
-                        },
-                        "title": menu_titles,
-                        "itemList": [
-                            {
-                                "title": f"조식 {breakfast_icon}",
-                                "description": "07:20 ~ 08:30"
-                            },
-                            {
-                                "title": f"중식 {lunch_icon}",
-                                "description": lunch_time_description
-                            },
-                            {
-                                "title": f"석식 {dinner_icon}",
-                                "description": "17:20 ~ 18:30"
-                            }
-                        ],
-                        "itemListAlignment": "right",
-                        "buttons": [
-                            {
-                              "action": "webLink",
-                              "label": "전체 메뉴 보러가기",
-                              "webLinkUrl": "https://www.mmu.ac.kr/main/contents/todayMenu2"
-                            }
-                        ]
-                    }
-                }
-            ],
+            # 메뉴가 길면 카드 여러 장으로 나눠 보냅니다.
+            "outputs": item_card_outputs(item_card),
             "quickReplies": [
                 {
                     "messageText": "인검전달사항",
@@ -230,10 +202,4 @@ def lambda_handler(event, context):
         }
     }
 
-    return {
-        'statusCode': 200,
-        'body': json.dumps(result, ensure_ascii=False),
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-        }
-    }
+    return lambda_response(result)